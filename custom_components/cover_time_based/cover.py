@@ -41,7 +41,6 @@ from .const import (
     DEFAULT_SLATS_TIME,  # Add this line to import DEFAULT_SLATS_TIME
 )
 from .travelcalculator import TravelCalculator
-from .travelcalculator import TravelStatus
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -142,6 +141,8 @@ class CoverTimeBased(CoverEntity, RestoreEntity):
         self._tilt_position = None
 
         self._unsubscribe_auto_updater = None
+        self._snapshot = None
+        self._tilt_snapshot = None
 
         self.tc = TravelCalculator(self._travel_time_down, self._travel_time_up, self._slats_open_time, self._slats_close_time)
         self.tilt_tc = TravelCalculator(self._slats_open_time, self._slats_close_time, self._slats_open_time, self._slats_close_time)
@@ -261,46 +262,49 @@ class CoverTimeBased(CoverEntity, RestoreEntity):
             attr[CONF_SLATS_CLOSE_TIME] = self._slats_close_time
         return attr
     
+    def _travel_snapshot(self):
+        """Return the travel state of the current state write, or a fresh one."""
+        return self._snapshot or self.tc.snapshot()
+
+    def _tilt_travel_snapshot(self):
+        """Return the tilt state of the current state write, or a fresh one."""
+        return self._tilt_snapshot or self.tilt_tc.snapshot()
+
     @property
     def current_cover_position(self):
         """Return the current position of the cover."""
-        return self.tc.current_position()
+        return self._travel_snapshot().position
 
     @property
     def is_opening(self):
         """Return if the cover is opening or not."""
-        return (
-            self.tc.is_traveling()
-            and self.tc.travel_direction == TravelStatus.DIRECTION_DOWN
-        )
+        return self._travel_snapshot().opening
 
     @property
     def is_closing(self):
         """Return if the cover is closing or not."""
-        return (
-            self.tc.is_traveling()
-            and self.tc.travel_direction == TravelStatus.DIRECTION_UP
-        )
+        return self._travel_snapshot().closing
 
     @property
     def is_closed(self):
         """Return if the cover is closed."""
-        return self.current_cover_position is None or self.current_cover_position <= 10
+        position = self.current_cover_position
+        return position is None or position <= 10
 
     @property
     def current_cover_tilt_position(self):
         """Return current tilt position of cover."""
-        return self.tilt_tc.current_position()
+        return self._tilt_travel_snapshot().position
 
     @property
     def is_opening_tilt(self):
         """Return if the cover is tilting open."""
-        return self.tilt_tc.is_traveling() and self.tilt_tc.travel_direction == TravelStatus.DIRECTION_DOWN
+        return self._tilt_travel_snapshot().opening
 
     @property
     def is_closing_tilt(self):
         """Return if the cover is tilting closed."""
-        return self.tilt_tc.is_traveling() and self.tilt_tc.travel_direction == TravelStatus.DIRECTION_UP
+        return self._tilt_travel_snapshot().closing
     
     @property
     def assumed_state(self):
@@ -438,11 +442,26 @@ class CoverTimeBased(CoverEntity, RestoreEntity):
     def auto_updater_hook(self, now):
         """Call for the autoupdater."""
         _LOGGER.debug("auto_updater_hook")
-        self.async_schedule_update_ha_state()
-        if self.position_reached():
+        if self._write_travel_state().reached:
             _LOGGER.debug("auto_updater_hook :: position_reached")
             self.stop_auto_updater()
-        self.hass.async_create_task(self.auto_stop_if_necessary())
+            self.hass.async_create_task(self.auto_stop_if_necessary())
+
+    @callback
+    def async_write_ha_state(self):
+        """Write the state to Home Assistant."""
+        self._write_travel_state()
+
+    def _write_travel_state(self):
+        """Write the state from one snapshot of each calculator and return it."""
+        snapshot = self._snapshot = self.tc.snapshot()
+        self._tilt_snapshot = self.tilt_tc.snapshot()
+        try:
+            super().async_write_ha_state()
+        finally:
+            self._snapshot = None
+            self._tilt_snapshot = None
+        return snapshot
 
     def stop_auto_updater(self):
         """Stop the autoupdater."""
@@ -15,16 +15,31 @@ E.g.:
 
 from __future__ import annotations
 
-import time
-from enum import Enum
+from enum import IntEnum
+from time import monotonic
+from typing import ClassVar
+from typing import NamedTuple
 
 
-class TravelStatus(Enum):
-    """Enum class for travel status."""
+class TravelStatus(IntEnum):
+    """Enum class for travel status, valued as the sign of the position change."""
 
-    DIRECTION_UP = 1
-    DIRECTION_DOWN = 2
-    STOPPED = 3
+    DIRECTION_UP = -1
+    DIRECTION_DOWN = 1
+    STOPPED = 0
+
+
+class TravelSnapshot(NamedTuple):
+    """Travel state of a cover at a single point in time.
+
+    Opening and closing follow the cover entity, which treats 100 as open.
+    """
+
+    position: int | None
+    travelling: bool
+    opening: bool
+    closing: bool
+    reached: bool
 
 
 class TravelCalculator:
@@ -36,14 +51,24 @@ class TravelCalculator:
         "travel_time_up",
         "slats_open_time",
         "slats_close_time",
+        "_has_slats",
         "_last_known_position",
         "_last_known_position_timestamp",
         "_position_confirmed",
         "_travel_to_position",
-        "position_closed",
-        "position_open",
+        "_travel_duration",
+        "_slats_duration",
+        "_slats_rate",
+        "_switch_position",
+        "_main_rate",
     )
 
+    # Travel "down" runs towards position_closed (100) and "up" towards
+    # position_open (0). The cover entity uses Home Assistant positions, where
+    # 100 is open, so traveling down opens the entity and up closes it.
+    position_closed: ClassVar[int] = 100
+    position_open: ClassVar[int] = 0
+
     def __init__(self, travel_time_down: float, travel_time_up: float, slats_open_time: float, slats_close_time: float) -> None:
         """Initialize TravelCalculator class."""
         self.travel_direction = TravelStatus.STOPPED
@@ -51,46 +76,55 @@ class TravelCalculator:
         self.travel_time_up = travel_time_up
         self.slats_open_time = slats_open_time
         self.slats_close_time = slats_close_time
+        self._has_slats: bool = bool(slats_open_time) or bool(slats_close_time)
 
         self._last_known_position: int | None = None
         self._last_known_position_timestamp: float = 0.0
         self._position_confirmed: bool = False
         self._travel_to_position: int | None = None
-
-        # 100 is closed, 0 is fully open
-        self.position_closed: int = 100
-        self.position_open: int = 0
+        self._travel_duration: float = 0.0
+        self._slats_duration: float = 0.0
+        self._slats_rate: float = 0.0
+        self._switch_position: float = 0.0
+        self._main_rate: float = 0.0
 
     def set_position(self, position: int) -> None:
         """Set the current position."""
         self._last_known_position = position
-        self._last_known_position_timestamp = time.time()
+        self._last_known_position_timestamp = monotonic()
         self._position_confirmed = True
+        self._plan_travel()
 
     def update_position(self, position: int) -> None:
         """Update known position of cover."""
         self._last_known_position = position
-        self._last_known_position_timestamp = time.time()
+        self._last_known_position_timestamp = monotonic()
+        self._plan_travel()
         if position == self._travel_to_position:
             self._position_confirmed = True
 
     def stop(self) -> None:
         """Stop traveling."""
-        stop_position = self.current_position()
+        self._freeze(monotonic())
+
+    def _freeze(self, now: float) -> int | None:
+        """Stop at the position calculated for `now` and return it."""
+        stop_position = self.current_position(now)
         if stop_position is None:
-            return
+            return None
         self._last_known_position = stop_position
+        self._last_known_position_timestamp = now
         self._travel_to_position = stop_position
         self._position_confirmed = False
         self.travel_direction = TravelStatus.STOPPED
+        return stop_position
 
     def start_travel(self, _travel_to_position: int) -> None:
         """Start traveling to position."""
         if self._last_known_position is None:
             self.set_position(_travel_to_position)
             return
-        self.stop()
-        self._last_known_position_timestamp = time.time()
+        self._freeze(monotonic())
         self._travel_to_position = _travel_to_position
         self._position_confirmed = False
 
@@ -99,6 +133,7 @@ class TravelCalculator:
             if _travel_to_position > self._last_known_position
             else TravelStatus.DIRECTION_UP
         )
+        self._plan_travel()
 
     def start_travel_up(self) -> None:
         """Start traveling up."""
@@ -108,36 +143,31 @@ class TravelCalculator:
         """Start traveling down."""
         self.start_travel(self.position_closed)
 
-    def start_travel_tilt(self, _travel_to_position: int) -> None:
-        """Start traveling tilt to position."""
-        if self._last_known_position is None:
-            self.set_position(_travel_to_position)
-            return
-        self.stop()
-        self._last_known_position_timestamp = time.time()
-        self._travel_to_position = _travel_to_position
-        self._position_confirmed = False
-
-        self.travel_direction = (
-            TravelStatus.DIRECTION_DOWN
-            if _travel_to_position > self._last_known_position
-            else TravelStatus.DIRECTION_UP
-        )
-
-    def start_travel_tilt_up(self) -> None:
-        """Start traveling tilt up."""
-        self.start_travel_tilt(self.position_open)
-
-    def start_travel_tilt_down(self) -> None:
-        """Start traveling tilt down."""
-        self.start_travel_tilt(self.position_closed)
+    # Tilt travels share the same position model as regular travels
+    start_travel_tilt = start_travel
+    start_travel_tilt_up = start_travel_up
+    start_travel_tilt_down = start_travel_down
 
-    def current_position(self) -> int | None:
+    def current_position(self, now: float | None = None) -> int | None:
         """Return current (calculated or known) position."""
         if not self._position_confirmed:
-            return self._calculate_position()
+            position = self._calculate_position(monotonic() if now is None else now)
+            return None if position is None else int(position + 0.5)
         return self._last_known_position
 
+    def snapshot(self) -> TravelSnapshot:
+        """Return position and travel state from a single calculation."""
+        position = self.current_position()
+        reached = position == self._travel_to_position
+        travelling = not reached
+        return TravelSnapshot(
+            position,
+            travelling,
+            travelling and self.travel_direction is TravelStatus.DIRECTION_DOWN,
+            travelling and self.travel_direction is TravelStatus.DIRECTION_UP,
+            reached,
+        )
+
     def is_traveling(self) -> bool:
         """Return if cover is traveling."""
         return self.current_position() != self._travel_to_position
@@ -145,13 +175,13 @@ class TravelCalculator:
     def is_opening(self) -> bool:
         """Return if the cover is opening."""
         return (
-            self.is_traveling() and self.travel_direction == TravelStatus.DIRECTION_UP
+            self.is_traveling() and self.travel_direction is TravelStatus.DIRECTION_UP
         )
 
     def is_closing(self) -> bool:
         """Return if the cover is closing."""
         return (
-            self.is_traveling() and self.travel_direction == TravelStatus.DIRECTION_DOWN
+            self.is_traveling() and self.travel_direction is TravelStatus.DIRECTION_DOWN
         )
 
     def position_reached(self) -> bool:
@@ -166,58 +196,76 @@ class TravelCalculator:
         """Return if cover is (fully) closed."""
         return self.current_position() == self.position_closed
 
-    def _calculate_position(self) -> int | None:
-        """Return calculated position."""
-        if self._travel_to_position is None or self._last_known_position is None:
+    def _calculate_position(self, now: float) -> float | None:
+        """Return calculated (unrounded) position at monotonic time `now`."""
+        direction = self.travel_direction
+        if direction is TravelStatus.STOPPED:
             return self._last_known_position
-        relative_position = self._travel_to_position - self._last_known_position
-
-        def position_reached_or_exceeded(relative_position: int) -> bool:
-            """Return if designated position was reached."""
-            if (
-                relative_position <= 0
-                and self.travel_direction == TravelStatus.DIRECTION_DOWN
-            ):
-                return True
-            if (
-                relative_position >= 0
-                and self.travel_direction == TravelStatus.DIRECTION_UP
-            ):
-                return True
-            return False
-
-        if position_reached_or_exceeded(relative_position):
-            return self._travel_to_position
-
-        remaining_travel_time = self.calculate_travel_time(
-            from_position=self._last_known_position,
-            to_position=self._travel_to_position,
+        target = self._travel_to_position
+        last = self._last_known_position
+        if target is None or last is None:
+            return last
+        relative_position = target - last
+        if relative_position * direction <= 0:
+            # Designated position was reached or exceeded
+            return target
+
+        elapsed_time = now - self._last_known_position_timestamp
+
+        if elapsed_time >= self._travel_duration:
+            return target
+
+        slats_duration = self._slats_duration
+        if elapsed_time < slats_duration:
+            # During slats adjustment, position changes very slowly
+            return last + self._slats_rate * elapsed_time
+        # Normal movement after slats adjustment
+        return self._switch_position + self._main_rate * (elapsed_time - slats_duration)
+
+    def _plan_travel(self) -> None:
+        """Precompute the movement segments of the current travel."""
+        target = self._travel_to_position
+        last = self._last_known_position
+        if target is None or last is None:
+            return
+        relative_position = target - last
+        travel_duration = self.calculate_travel_time(
+            from_position=last,
+            to_position=target,
         )
-        elapsed_time = time.time() - self._last_known_position_timestamp
 
-        if elapsed_time > remaining_travel_time:
-            return self._travel_to_position
-
-        # Calculate the progress considering slats time
-        slats_time = 0
-        if self._last_known_position == 0 or self._travel_to_position == 0:
-            slats_time = self.slats_close_time if self.travel_direction == TravelStatus.DIRECTION_DOWN else self.slats_open_time
-        if elapsed_time < slats_time:
-            # During slats adjustment, position changes very slowly
-            progress = elapsed_time / slats_time * 0.1  # Assume 10% of the movement during slats adjustment
-        else:
-            # Normal movement after slats adjustment
-            progress = (elapsed_time - slats_time) / (remaining_travel_time - slats_time)
+        # Slats adjustment can only outlast the whole travel when the slats
+        # time is configured longer than the travel time
+        slats_time = min(self._slats_time(last, target), travel_duration)
+        self._travel_duration = travel_duration
+        self._slats_duration = slats_time
+        # Assume 10% of the movement during slats adjustment
+        slats_movement = relative_position * 0.1 if slats_time else 0.0
+        self._slats_rate = slats_movement / slats_time if slats_time else 0.0
+        self._switch_position = last + slats_movement
+        main_time = travel_duration - slats_time
+        self._main_rate = (
+            (relative_position - slats_movement) / main_time if main_time else 0.0
+        )
 
-        return int(self._last_known_position + relative_position * progress)
+    def _slats_time(self, from_position: int, to_position: int) -> float:
+        """Return the slats adjustment time of a travel."""
+        if not self._has_slats or (from_position != 0 and to_position != 0):
+            return 0
+        # Decreasing positions close the entity, which treats 100 as open
+        return (
+            self.slats_close_time
+            if from_position > to_position
+            else self.slats_open_time
+        )
 
     def calculate_travel_time(self, from_position: int, to_position: int) -> float:
         """Calculate time to travel from one position to another."""
         travel_range = abs(to_position - from_position)
+        # Decreasing positions close the entity, which treats 100 as open
+        entity_closing = from_position > to_position
         travel_time_full = (
-            self.travel_time_down if from_position > to_position else self.travel_time_up
+            self.travel_time_down if entity_closing else self.travel_time_up
         )
-        slats_time = 0
-        if from_position == 0 or to_position == 0:
-            slats_time = self.slats_close_time if from_position > to_position else self.slats_open_time
+        slats_time = self._slats_time(from_position, to_position)
         return (travel_time_full - slats_time) * (travel_range / 100) + slats_time